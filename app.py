@@ -7,6 +7,9 @@ from observability.stacks.automation_stack import AutomationStack
 from observability.stacks.cost_monitoring_stack import CostMonitoringStack
 from observability.stacks.log_analysis_stack import LogAnalysisStack
 
+# Stack keys accepted by the "stacks" context value
+STACKS = ("core", "dashboards", "alerting", "automation", "cost", "logs")
+
 app = cdk.App()
 
 # Get environment configuration
@@ -16,6 +19,16 @@ region = app.node.try_get_context("region") or "us-east-1"
 
 env = cdk.Environment(account=account, region=region)
 
+# Stack selection (e.g. --context stacks=core,logs) builds and synthesizes
+# only the chosen stacks; every stack depends on core, automation also on alerting
+selected = app.node.try_get_context("stacks")
+enabled = {key.strip() for key in selected.split(",") if key.strip()} if selected else set(STACKS)
+unknown = enabled - set(STACKS)
+if unknown:
+    raise ValueError(f"Unknown stacks: {', '.join(sorted(unknown))}")
+if "automation" in enabled:
+    enabled.add("alerting")
+
 # Core observability infrastructure
 core_stack = CoreObservabilityStack(
     app, f"ObservabilityCore-{env_name}",
@@ -24,44 +37,49 @@ core_stack = CoreObservabilityStack(
 )
 
 # Dashboards for monitoring
-dashboard_stack = DashboardStack(
-    app, f"ObservabilityDashboards-{env_name}",
-    env=env,
-    environment=env_name,
-    core_resources=core_stack.core_resources
-)
+if "dashboards" in enabled:
+    dashboard_stack = DashboardStack(
+        app, f"ObservabilityDashboards-{env_name}",
+        env=env,
+        environment=env_name,
+        core_resources=core_stack.core_resources
+    )
 
 # Alerting and notifications
-alerting_stack = AlertingStack(
-    app, f"ObservabilityAlerting-{env_name}",
-    env=env,
-    environment=env_name,
-    core_resources=core_stack.core_resources
-)
+if "alerting" in enabled:
+    alerting_stack = AlertingStack(
+        app, f"ObservabilityAlerting-{env_name}",
+        env=env,
+        environment=env_name,
+        core_resources=core_stack.core_resources
+    )
 
 # Automation and remediation
-automation_stack = AutomationStack(
-    app, f"ObservabilityAutomation-{env_name}",
-    env=env,
-    environment=env_name,
-    core_resources=core_stack.core_resources,
-    alerting_resources=alerting_stack.alerting_resources
-)
+if "automation" in enabled:
+    automation_stack = AutomationStack(
+        app, f"ObservabilityAutomation-{env_name}",
+        env=env,
+        environment=env_name,
+        core_resources=core_stack.core_resources,
+        alerting_resources=alerting_stack.alerting_resources
+    )
 
 # Cost monitoring
-cost_stack = CostMonitoringStack(
-    app, f"ObservabilityCost-{env_name}",
-    env=env,
-    environment=env_name,
-    core_resources=core_stack.core_resources
-)
+if "cost" in enabled:
+    cost_stack = CostMonitoringStack(
+        app, f"ObservabilityCost-{env_name}",
+        env=env,
+        environment=env_name,
+        core_resources=core_stack.core_resources
+    )
 
 # Log analysis
-log_stack = LogAnalysisStack(
-    app, f"ObservabilityLogs-{env_name}",
-    env=env,
-    environment=env_name,
-    core_resources=core_stack.core_resources
-)
+if "logs" in enabled:
+    log_stack = LogAnalysisStack(
+        app, f"ObservabilityLogs-{env_name}",
+        env=env,
+        environment=env_name,
+        core_resources=core_stack.core_resources
+    )
 
 app.synth()
\ No newline at end of file
@@ -1,14 +1,16 @@
-from typing import Dict, List, Optional
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
-class MetricConfig(BaseModel):
+@dataclass(frozen=True)
+class MetricConfig:
     namespace: str
     metric_name: str
-    dimensions: Dict[str, str]
+    dimensions: Tuple[Tuple[str, str], ...]
     statistic: str = "Average"
     period: int = 300
 
-class AlertConfig(BaseModel):
+@dataclass(frozen=True)
+class AlertConfig:
     name: str
     description: str
     metric: MetricConfig
@@ -17,88 +19,93 @@ class AlertConfig(BaseModel):
     evaluation_periods: int = 2
     datapoints_to_alarm: int = 2
 
-class ServiceConfig(BaseModel):
+@dataclass(frozen=True)
+class ServiceConfig:
     service_name: str
-    metrics: List[MetricConfig]
-    alerts: List[AlertConfig]
-    log_groups: List[str]
+    metrics: Tuple[MetricConfig, ...]
+    alerts: Tuple[AlertConfig, ...]
+    log_groups: Tuple[str, ...]
 
-class MonitoringConfig:
-    # Default metrics for AWS services
-    EC2_METRICS = [
-        MetricConfig(namespace="AWS/EC2", metric_name="CPUUtilization", dimensions={"InstanceId": "*"}),
-        MetricConfig(namespace="AWS/EC2", metric_name="NetworkIn", dimensions={"InstanceId": "*"}),
-        MetricConfig(namespace="AWS/EC2", metric_name="NetworkOut", dimensions={"InstanceId": "*"}),
-        MetricConfig(namespace="AWS/EC2", metric_name="DiskReadOps", dimensions={"InstanceId": "*"}),
-        MetricConfig(namespace="AWS/EC2", metric_name="DiskWriteOps", dimensions={"InstanceId": "*"})
-    ]
-    
-    LAMBDA_METRICS = [
-        MetricConfig(namespace="AWS/Lambda", metric_name="Duration", dimensions={"FunctionName": "*"}),
-        MetricConfig(namespace="AWS/Lambda", metric_name="Errors", dimensions={"FunctionName": "*"}),
-        MetricConfig(namespace="AWS/Lambda", metric_name="Invocations", dimensions={"FunctionName": "*"}),
-        MetricConfig(namespace="AWS/Lambda", metric_name="Throttles", dimensions={"FunctionName": "*"}),
-        MetricConfig(namespace="AWS/Lambda", metric_name="ConcurrentExecutions", dimensions={"FunctionName": "*"})
-    ]
-    
-    RDS_METRICS = [
-        MetricConfig(namespace="AWS/RDS", metric_name="CPUUtilization", dimensions={"DBInstanceIdentifier": "*"}),
-        MetricConfig(namespace="AWS/RDS", metric_name="DatabaseConnections", dimensions={"DBInstanceIdentifier": "*"}),
-        MetricConfig(namespace="AWS/RDS", metric_name="FreeableMemory", dimensions={"DBInstanceIdentifier": "*"}),
-        MetricConfig(namespace="AWS/RDS", metric_name="ReadLatency", dimensions={"DBInstanceIdentifier": "*"}),
-        MetricConfig(namespace="AWS/RDS", metric_name="WriteLatency", dimensions={"DBInstanceIdentifier": "*"})
-    ]
-    
-    ECS_METRICS = [
-        MetricConfig(namespace="AWS/ECS", metric_name="CPUUtilization", dimensions={"ServiceName": "*", "ClusterName": "*"}),
-        MetricConfig(namespace="AWS/ECS", metric_name="MemoryUtilization", dimensions={"ServiceName": "*", "ClusterName": "*"}),
-        MetricConfig(namespace="AWS/ECS", metric_name="RunningTaskCount", dimensions={"ServiceName": "*", "ClusterName": "*"})
-    ]
-    
-    # Default alert thresholds
-    DEFAULT_ALERTS = {
-        "high_cpu": AlertConfig(
-            name="HighCPUUtilization",
-            description="CPU utilization is above 80%",
-            metric=MetricConfig(namespace="AWS/EC2", metric_name="CPUUtilization", dimensions={"InstanceId": "*"}),
-            threshold=80.0,
-            comparison_operator="GreaterThanThreshold"
-        ),
-        "high_error_rate": AlertConfig(
-            name="HighErrorRate",
-            description="Error rate is above 5%",
-            metric=MetricConfig(namespace="AWS/Lambda", metric_name="Errors", dimensions={"FunctionName": "*"}),
-            threshold=5.0,
-            comparison_operator="GreaterThanThreshold"
-        )
-    }
-    
-    @classmethod
-    def get_service_config(cls, service_type: str) -> Optional[ServiceConfig]:
-        configs = {
-            "ec2": ServiceConfig(
-                service_name="EC2",
-                metrics=cls.EC2_METRICS,
-                alerts=[cls.DEFAULT_ALERTS["high_cpu"]],
-                log_groups=["/aws/ec2/*"]
-            ),
-            "lambda": ServiceConfig(
-                service_name="Lambda",
-                metrics=cls.LAMBDA_METRICS,
-                alerts=[cls.DEFAULT_ALERTS["high_error_rate"]],
-                log_groups=["/aws/lambda/*"]
-            ),
-            "rds": ServiceConfig(
-                service_name="RDS",
-                metrics=cls.RDS_METRICS,
-                alerts=[],
-                log_groups=["/aws/rds/*"]
-            ),
-            "ecs": ServiceConfig(
-                service_name="ECS",
-                metrics=cls.ECS_METRICS,
-                alerts=[],
-                log_groups=["/aws/ecs/*"]
-            )
-        }
-        return configs.get(service_type)
\ No newline at end of file
+# Metrics shared between the service metric lists and the default alerts
+EC2_CPU = MetricConfig(namespace="AWS/EC2", metric_name="CPUUtilization", dimensions=(("InstanceId", "*"),))
+LAMBDA_ERRORS = MetricConfig(namespace="AWS/Lambda", metric_name="Errors", dimensions=(("FunctionName", "*"),))
+
+# Default metrics for AWS services
+EC2_METRICS = (
+    EC2_CPU,
+    MetricConfig(namespace="AWS/EC2", metric_name="NetworkIn", dimensions=(("InstanceId", "*"),)),
+    MetricConfig(namespace="AWS/EC2", metric_name="NetworkOut", dimensions=(("InstanceId", "*"),)),
+    MetricConfig(namespace="AWS/EC2", metric_name="DiskReadOps", dimensions=(("InstanceId", "*"),)),
+    MetricConfig(namespace="AWS/EC2", metric_name="DiskWriteOps", dimensions=(("InstanceId", "*"),))
+)
+
+LAMBDA_METRICS = (
+    MetricConfig(namespace="AWS/Lambda", metric_name="Duration", dimensions=(("FunctionName", "*"),)),
+    LAMBDA_ERRORS,
+    MetricConfig(namespace="AWS/Lambda", metric_name="Invocations", dimensions=(("FunctionName", "*"),)),
+    MetricConfig(namespace="AWS/Lambda", metric_name="Throttles", dimensions=(("FunctionName", "*"),)),
+    MetricConfig(namespace="AWS/Lambda", metric_name="ConcurrentExecutions", dimensions=(("FunctionName", "*"),))
+)
+
+RDS_METRICS = (
+    MetricConfig(namespace="AWS/RDS", metric_name="CPUUtilization", dimensions=(("DBInstanceIdentifier", "*"),)),
+    MetricConfig(namespace="AWS/RDS", metric_name="DatabaseConnections", dimensions=(("DBInstanceIdentifier", "*"),)),
+    MetricConfig(namespace="AWS/RDS", metric_name="FreeableMemory", dimensions=(("DBInstanceIdentifier", "*"),)),
+    MetricConfig(namespace="AWS/RDS", metric_name="ReadLatency", dimensions=(("DBInstanceIdentifier", "*"),)),
+    MetricConfig(namespace="AWS/RDS", metric_name="WriteLatency", dimensions=(("DBInstanceIdentifier", "*"),))
+)
+
+ECS_METRICS = (
+    MetricConfig(namespace="AWS/ECS", metric_name="CPUUtilization", dimensions=(("ServiceName", "*"), ("ClusterName", "*"))),
+    MetricConfig(namespace="AWS/ECS", metric_name="MemoryUtilization", dimensions=(("ServiceName", "*"), ("ClusterName", "*"))),
+    MetricConfig(namespace="AWS/ECS", metric_name="RunningTaskCount", dimensions=(("ServiceName", "*"), ("ClusterName", "*")))
+)
+
+# Default alert thresholds
+DEFAULT_ALERTS = {
+    "high_cpu": AlertConfig(
+        name="HighCPUUtilization",
+        description="CPU utilization is above 80%",
+        metric=EC2_CPU,
+        threshold=80.0,
+        comparison_operator="GreaterThanThreshold"
+    ),
+    "high_error_rate": AlertConfig(
+        name="HighErrorRate",
+        description="Error rate is above 5%",
+        metric=LAMBDA_ERRORS,
+        threshold=5.0,
+        comparison_operator="GreaterThanThreshold"
+    )
+}
+
+# Service configurations, built once at import time
+_SERVICE_CONFIGS: Dict[str, ServiceConfig] = {
+    "ec2": ServiceConfig(
+        service_name="EC2",
+        metrics=EC2_METRICS,
+        alerts=(DEFAULT_ALERTS["high_cpu"],),
+        log_groups=("/aws/ec2/*",)
+    ),
+    "lambda": ServiceConfig(
+        service_name="Lambda",
+        metrics=LAMBDA_METRICS,
+        alerts=(DEFAULT_ALERTS["high_error_rate"],),
+        log_groups=("/aws/lambda/*",)
+    ),
+    "rds": ServiceConfig(
+        service_name="RDS",
+        metrics=RDS_METRICS,
+        alerts=(),
+        log_groups=("/aws/rds/*",)
+    ),
+    "ecs": ServiceConfig(
+        service_name="ECS",
+        metrics=ECS_METRICS,
+        alerts=(),
+        log_groups=("/aws/ecs/*",)
+    )
+}
+
+def get_service_config(service_type: str) -> Optional[ServiceConfig]:
+    return _SERVICE_CONFIGS.get(service_type)
\ No newline at end of file
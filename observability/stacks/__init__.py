@@ -0,0 +1,12 @@
+from aws_cdk import aws_iam as iam, aws_lambda as lambda_
+from functools import lru_cache
+
+# Runtime for every platform function; the pinned aws-cdk-lib predates the
+# PYTHON_3_12 constant. Inline code is allowed so the same runtime serves
+# asset-based and inline functions
+PYTHON_3_12 = lambda_.Runtime("python3.12", lambda_.RuntimeFamily.PYTHON, supports_inline_code=True)
+
+@lru_cache(maxsize=None)
+def managed_policy(name: str) -> iam.IManagedPolicy:
+    """Look up an AWS managed policy once per name, shared across stacks"""
+    return iam.ManagedPolicy.from_aws_managed_policy_name(name)
\ No newline at end of file
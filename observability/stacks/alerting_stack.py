@@ -12,7 +12,21 @@ from aws_cdk import (
 )
 from constructs import Construct
 from typing import Dict, Any
-# from ..config.monitoring_config import MonitoringConfig
+# from ..config.monitoring_config import get_service_config
+
+# Evaluation period shared by the default alarms
+_FIVE_MINUTES = Duration.minutes(5)
+
+# Alert severities with their precomputed title and upper case forms
+_SEVERITIES = (
+    ("critical", "Critical", "CRITICAL"),
+    ("high", "High", "HIGH"),
+    ("medium", "Medium", "MEDIUM"),
+    ("low", "Low", "LOW")
+)
+
+# Alert processor environment variable holding each severity's topic ARN
+_SEVERITY_ENV_KEYS = {severity: f"TOPIC_ARN_{upper}" for severity, _, upper in _SEVERITIES}
 
 class AlertingStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, environment: str, core_resources: Dict[str, Any], **kwargs) -> None:
@@ -30,35 +44,35 @@ class AlertingStack(Stack):
     
     def _create_notification_topics(self):
         """Create SNS topics for different alert severities"""
-        severities = ["critical", "high", "medium", "low"]
-        self.alerting_resources["topics"] = {}
+        topics = self.alerting_resources["topics"] = {}
         
-        for severity in severities:
+        # Email subscriptions (will be confirmed manually)
+        # In production, you'd get this from SSM Parameter or context
+        email = self.node.try_get_context("alert_email")
+        
+        for severity, title, _ in _SEVERITIES:
             topic = sns.Topic(
-                self, f"AlertTopic{severity.title()}",
-                display_name=f"Observability {severity.title()} Alerts",
+                self, f"AlertTopic{title}",
+                display_name=f"Observability {title} Alerts",
                 master_key=self.core_resources["kms_key"]
             )
             
-            # Add email subscription (will be confirmed manually)
-            # In production, you'd get this from SSM Parameter or context
-            email = self.node.try_get_context("alert_email")
             if email:
-                subscriptions.EmailSubscription(email)
+                topic.add_subscription(subscriptions.EmailSubscription(email))
             
-            self.alerting_resources["topics"][severity] = topic
-        
-        # Store topic ARNs in SSM for external access
-        for severity, topic in self.alerting_resources["topics"].items():
+            # Store topic ARN in SSM for external access
             ssm.StringParameter(
-                self, f"AlertTopicArn{severity.title()}",
+                self, f"AlertTopicArn{title}",
                 parameter_name=f"/observability/{self.env_name}/alerts/topics/{severity}",
                 string_value=topic.topic_arn
             )
+            
+            topics[severity] = topic
     
     def _create_alert_processor(self):
         """Create Lambda function to process and enrich alerts"""
-        self.alerting_resources["processor"] = lambda_.Function(
+        topics = self.alerting_resources["topics"]
+        processor = self.alerting_resources["processor"] = lambda_.Function(
             self, "AlertProcessor",
             runtime=lambda_.Runtime.PYTHON_3_9,
             handler="index.handler",
@@ -69,8 +83,8 @@ class AlertingStack(Stack):
             environment={
                 "ENVIRONMENT": self.env_name,
                 "EVENT_BUS_NAME": self.core_resources["event_bus"].event_bus_name,
-                **{f"TOPIC_ARN_{sev.upper()}": topic.topic_arn 
-                   for sev, topic in self.alerting_resources["topics"].items()}
+                **{_SEVERITY_ENV_KEYS[sev]: topic.topic_arn
+                   for sev, topic in topics.items()}
             }
         )
         
@@ -81,7 +95,7 @@ class AlertingStack(Stack):
                 source=["aws.cloudwatch"],
                 detail_type=["CloudWatch Alarm State Change"]
             ),
-            targets=[targets.LambdaFunction(self.alerting_resources["processor"])]
+            targets=[targets.LambdaFunction(processor)]
         )
         
         # Subscribe to custom EventBridge events
@@ -92,12 +106,13 @@ class AlertingStack(Stack):
                 source=["observability.custom"],
                 detail_type=["Custom Metric Alert"]
             ),
-            targets=[targets.LambdaFunction(self.alerting_resources["processor"])]
+            targets=[targets.LambdaFunction(processor)]
         )
     
     def _create_default_alarms(self):
         """Create default alarms for common scenarios"""
-        self.alerting_resources["alarms"] = {}
+        topics = self.alerting_resources["topics"]
+        alarms = self.alerting_resources["alarms"] = {}
         
         # High Lambda error rate alarm
         lambda_error_alarm = cloudwatch.Alarm(
@@ -108,7 +123,7 @@ class AlertingStack(Stack):
                 namespace="AWS/Lambda",
                 metric_name="Errors",
                 statistic="Sum",
-                period=Duration.minutes(5)
+                period=_FIVE_MINUTES
             ),
             threshold=10,
             evaluation_periods=2,
@@ -118,7 +133,7 @@ class AlertingStack(Stack):
         )
         
         lambda_error_alarm.add_alarm_action(
-            cw_actions.SnsAction(self.alerting_resources["topics"]["high"])
+            cw_actions.SnsAction(topics["high"])
         )
         
         # High EC2 CPU utilization
@@ -130,7 +145,7 @@ class AlertingStack(Stack):
                 namespace="AWS/EC2",
                 metric_name="CPUUtilization",
                 statistic="Average",
-                period=Duration.minutes(5)
+                period=_FIVE_MINUTES
             ),
             threshold=80,
             evaluation_periods=3,
@@ -139,11 +154,11 @@ class AlertingStack(Stack):
         )
         
         ec2_cpu_alarm.add_alarm_action(
-            cw_actions.SnsAction(self.alerting_resources["topics"]["medium"])
+            cw_actions.SnsAction(topics["medium"])
         )
         
-        self.alerting_resources["alarms"]["lambda_errors"] = lambda_error_alarm
-        self.alerting_resources["alarms"]["ec2_cpu"] = ec2_cpu_alarm
+        alarms["lambda_errors"] = lambda_error_alarm
+        alarms["ec2_cpu"] = ec2_cpu_alarm
     
     def _create_composite_alarms(self):
         """Create composite alarms for system-wide health"""
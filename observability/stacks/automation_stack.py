@@ -9,7 +9,18 @@ from aws_cdk import (
     Duration
 )
 from constructs import Construct
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from observability.stacks import PYTHON_3_12, managed_policy
+
+# Shared by the function timeouts and the recovery wait
+_TWO_MINUTES = Duration.minutes(2)
+
+# Handler packages for the automation functions, relative to the app root
+_HANDLER_ROOT = "src/lambda/automation"
+
+# Concurrency cap so an alert storm cannot starve the rest of the account
+_RESERVED_CONCURRENCY = 5
 
 class AutomationStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, environment: str, 
@@ -20,6 +31,11 @@ class AutomationStack(Stack):
         self.core_resources = core_resources
         self.alerting_resources = alerting_resources
         self.automation_resources = {}
+        self.workflow_name = f"observability-remediation-{self.env_name}"
+        
+        # Settings shared by all automation functions
+        self._architecture = lambda_.Architecture.ARM_64
+        self._tracing = lambda_.Tracing.ACTIVE
         
         # Create automation components
         self._create_automation_role()
@@ -29,88 +45,103 @@ class AutomationStack(Stack):
     
     def _create_automation_role(self):
         """Create IAM role for automation functions"""
+        arn_prefix = f"arn:{self.partition}"
+        region_account = f"{self.region}:{self.account}"
+        
         self.automation_role = iam.Role(
             self, "AutomationRole",
             assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
             managed_policies=[
-                iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole"),
-                iam.ManagedPolicy.from_aws_managed_policy_name("AWSXRayDaemonWriteAccess")
+                managed_policy("service-role/AWSLambdaBasicExecutionRole"),
+                managed_policy("AWSXRayDaemonWriteAccess")
             ],
             inline_policies={
                 "AutomationPolicy": iam.PolicyDocument(
                     statements=[
+                        # DescribeInstances does not support resource-level permissions
                         iam.PolicyStatement(
                             effect=iam.Effect.ALLOW,
-                            actions=[
-                                "ec2:RebootInstances",
-                                "ec2:DescribeInstances",
-                                "lambda:UpdateFunctionConfiguration",
-                                "lambda:GetFunction",
-                                "ecs:UpdateService",
-                                "ecs:DescribeServices",
-                                "cloudwatch:PutMetricData",
-                                "stepfunctions:StartExecution",
-                                "sns:Publish"
-                            ],
+                            actions=["ec2:DescribeInstances"],
                             resources=["*"]
+                        ),
+                        iam.PolicyStatement(
+                            effect=iam.Effect.ALLOW,
+                            actions=["ec2:RebootInstances"],
+                            resources=[f"{arn_prefix}:ec2:{region_account}:instance/*"]
+                        ),
+                        # Built from the state machine name; referencing the state
+                        # machine itself would create a dependency cycle through
+                        # the functions it invokes
+                        iam.PolicyStatement(
+                            effect=iam.Effect.ALLOW,
+                            actions=["states:StartExecution"],
+                            resources=[
+                                f"{arn_prefix}:states:{region_account}:stateMachine:{self.workflow_name}"
+                            ]
+                        ),
+                        iam.PolicyStatement(
+                            effect=iam.Effect.ALLOW,
+                            actions=["sns:Publish"],
+                            resources=[self.alerting_resources["topics"]["critical"].topic_arn]
                         )
                     ]
                 )
             }
         )
-    
-    def _create_remediation_functions(self):
-        """Create Lambda functions for automated remediation"""
-        
-        # EC2 instance restart function
-        self.automation_resources["ec2_restart"] = lambda_.Function(
-            self, "EC2RestartFunction",
-            runtime=lambda_.Runtime.PYTHON_3_9,
-            handler="index.handler",
-            code=lambda_.Code.from_inline("def handler(event, context): return {'statusCode': 200}"),
-            role=self.automation_role,
-            timeout=Duration.minutes(2),
-            tracing=lambda_.Tracing.ACTIVE
-        )
         
-        # Lambda function restart function
-        self.automation_resources["lambda_restart"] = lambda_.Function(
-            self, "LambdaRestartFunction",
-            runtime=lambda_.Runtime.PYTHON_3_9,
-            handler="index.handler",
-            code=lambda_.Code.from_inline("def handler(event, context): return {'statusCode': 200}"),
+        # The alert topics are encrypted with the platform key, so publishing
+        # needs to generate and decrypt data keys with it
+        self.core_resources["kms_key"].grant(self.automation_role, "kms:GenerateDataKey*", "kms:Decrypt")
+    
+    def _create_automation_function(self, construct_id: str, package: str,
+                                    environment: Optional[Dict[str, str]] = None) -> lambda_.Function:
+        """Create an automation function from a handler package under src/lambda/automation"""
+        return lambda_.Function(
+            self, construct_id,
+            runtime=PYTHON_3_12,
+            architecture=self._architecture,
+            handler="handler.handler",
+            code=lambda_.Code.from_asset(f"{_HANDLER_ROOT}/{package}", exclude=["__pycache__"]),
             role=self.automation_role,
-            timeout=Duration.minutes(2),
-            tracing=lambda_.Tracing.ACTIVE
+            timeout=_TWO_MINUTES,
+            tracing=self._tracing,
+            environment=environment,
+            reserved_concurrent_executions=_RESERVED_CONCURRENCY
         )
+    
+    def _create_remediation_functions(self):
+        """Create Lambda functions for automated remediation"""
         
-        # ECS service scaling function
-        self.automation_resources["ecs_scale"] = lambda_.Function(
-            self, "ECSScaleFunction",
-            runtime=lambda_.Runtime.PYTHON_3_9,
-            handler="index.handler",
-            code=lambda_.Code.from_inline("def handler(event, context): return {'statusCode': 200}"),
-            role=self.automation_role,
-            timeout=Duration.minutes(2),
-            tracing=lambda_.Tracing.ACTIVE
+        # Single remediation function dispatching on the event's "action" key,
+        # so every workflow step shares the same warm sandboxes
+        self.automation_resources["remediation"] = self._create_automation_function(
+            "RemediationDispatcher", "ec2_remediation"
         )
     
     def _create_remediation_workflows(self):
         """Create Step Functions workflows for complex remediation"""
         
         # Define remediation workflow
+        remediation = self.automation_resources["remediation"]
+        
         check_health = tasks.LambdaInvoke(
             self, "CheckHealth",
-            lambda_function=self.automation_resources["ec2_restart"],
+            lambda_function=remediation,
+            result_selector={"status.$": "$.Payload.status"},
+            result_path="$.health",
             payload=sfn.TaskInput.from_object({
                 "action": "check_health",
                 "resource_id.$": "$.resource_id"
             })
         )
         
+        # Fire-and-forget; the async invoke returns no payload, so the result is
+        # discarded
         restart_resource = tasks.LambdaInvoke(
             self, "RestartResource",
-            lambda_function=self.automation_resources["ec2_restart"],
+            lambda_function=remediation,
+            invocation_type=tasks.LambdaInvocationType.EVENT,
+            result_path=sfn.JsonPath.DISCARD,
             payload=sfn.TaskInput.from_object({
                 "action": "restart",
                 "resource_id.$": "$.resource_id"
@@ -119,12 +150,14 @@ class AutomationStack(Stack):
         
         wait_for_recovery = sfn.Wait(
             self, "WaitForRecovery",
-            time=sfn.WaitTime.duration(Duration.minutes(2))
+            time=sfn.WaitTime.duration(_TWO_MINUTES)
         )
         
         verify_recovery = tasks.LambdaInvoke(
             self, "VerifyRecovery",
-            lambda_function=self.automation_resources["ec2_restart"],
+            lambda_function=remediation,
+            result_selector={"status.$": "$.Payload.status"},
+            result_path="$.health",
             payload=sfn.TaskInput.from_object({
                 "action": "verify",
                 "resource_id.$": "$.resource_id"
@@ -134,32 +167,26 @@ class AutomationStack(Stack):
         success_state = sfn.Succeed(self, "RemediationSuccess")
         failure_state = sfn.Fail(self, "RemediationFailed")
         
-        # Define workflow
-        definition = check_health.next(
-            sfn.Choice(self, "IsHealthy")
-            .when(
-                sfn.Condition.string_equals("$.status", "healthy"),
-                success_state
-            )
-            .otherwise(
-                restart_resource.next(
-                    wait_for_recovery.next(
-                        verify_recovery.next(
-                            sfn.Choice(self, "IsRecovered")
-                            .when(
-                                sfn.Condition.string_equals("$.status", "healthy"),
-                                success_state
-                            )
-                            .otherwise(failure_state)
-                        )
-                    )
-                )
-            )
-        )
+        # Wire the workflow edges explicitly, then start from the health check.
+        # The health checks store only the handler's status under $.health so
+        # resource_id stays in the state for the later steps
+        is_recovered = sfn.Choice(self, "IsRecovered")
+        is_recovered.when(sfn.Condition.string_equals("$.health.status", "healthy"), success_state)
+        is_recovered.otherwise(failure_state)
+        
+        verify_recovery.next(is_recovered)
+        wait_for_recovery.next(verify_recovery)
+        restart_resource.next(wait_for_recovery)
+        
+        is_healthy = sfn.Choice(self, "IsHealthy")
+        is_healthy.when(sfn.Condition.string_equals("$.health.status", "healthy"), success_state)
+        is_healthy.otherwise(restart_resource)
+        
+        definition = check_health.next(is_healthy)
         
         self.automation_resources["remediation_workflow"] = sfn.StateMachine(
             self, "RemediationWorkflow",
-            state_machine_name=f"observability-remediation-{self.env_name}",
+            state_machine_name=self.workflow_name,
             definition=definition,
             timeout=Duration.minutes(15)
         )
@@ -168,20 +195,22 @@ class AutomationStack(Stack):
         """Create incident response automation"""
         
         # Incident response orchestrator
-        incident_responder = lambda_.Function(
-            self, "IncidentResponder",
-            runtime=lambda_.Runtime.PYTHON_3_9,
-            handler="index.handler",
-            code=lambda_.Code.from_inline("def handler(event, context): return {'statusCode': 200}"),
-            role=self.automation_role,
-            timeout=Duration.minutes(2),
-            tracing=lambda_.Tracing.ACTIVE,
+        incident_responder = self._create_automation_function(
+            "IncidentResponder", "incident_response",
             environment={
                 "REMEDIATION_WORKFLOW_ARN": self.automation_resources["remediation_workflow"].state_machine_arn,
                 "INCIDENT_TOPIC_ARN": self.alerting_resources["topics"]["critical"].topic_arn
             }
         )
         
+        # Keep one warm instance behind a "live" alias in prod so the first
+        # critical alert does not pay for a cold start
+        if self.env_name == "prod":
+            incident_responder = incident_responder.add_alias(
+                "live",
+                provisioned_concurrent_executions=1
+            )
+        
         # Subscribe to alert events
         events.Rule(
             self, "IncidentResponseRule",
@@ -12,6 +12,19 @@ from aws_cdk import (
 from constructs import Construct
 from typing import Dict, Any
 
+from observability.stacks import managed_policy
+
+# Platform log groups as (name, logical ID, log group path, retention); a
+# retention of None uses the environment default. Automation and cost monitor
+# logs are low-volume remediation confirmations that are only useful for a week
+_LOG_GROUP_SPECS = (
+    ("platform_logs", "LogGroupPlatformLogs", "/observability/platform", None),
+    ("metric_collector_logs", "LogGroupMetricCollectorLogs", "/observability/metric-collector", None),
+    ("alert_processor_logs", "LogGroupAlertProcessorLogs", "/observability/alert-processor", None),
+    ("automation_logs", "LogGroupAutomationLogs", "/observability/automation", logs.RetentionDays.ONE_WEEK),
+    ("cost_monitor_logs", "LogGroupCostMonitorLogs", "/observability/cost-monitor", logs.RetentionDays.ONE_WEEK)
+)
+
 class CoreObservabilityStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, environment: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -71,23 +84,18 @@ class CoreObservabilityStack(Stack):
     
     def _create_log_groups(self):
         """Create CloudWatch log groups for the platform"""
-        log_groups = {
-            "platform_logs": "/observability/platform",
-            "metric_collector_logs": "/observability/metric-collector",
-            "alert_processor_logs": "/observability/alert-processor",
-            "automation_logs": "/observability/automation",
-            "cost_monitor_logs": "/observability/cost-monitor"
-        }
+        default_retention = logs.RetentionDays.ONE_MONTH if self.env_name == "dev" else logs.RetentionDays.SIX_MONTHS
         
-        self.core_resources["log_groups"] = {}
-        for name, log_group_name in log_groups.items():
-            self.core_resources["log_groups"][name] = logs.LogGroup(
-                self, f"LogGroup{name.title().replace('_', '')}",
+        self.core_resources["log_groups"] = {
+            name: logs.LogGroup(
+                self, logical_id,
                 log_group_name=log_group_name,
-                retention=logs.RetentionDays.ONE_MONTH if self.env_name == "dev" else logs.RetentionDays.SIX_MONTHS,
+                retention=retention or default_retention,
                 encryption_key=self.core_resources["kms_key"],
                 removal_policy=RemovalPolicy.DESTROY
             )
+            for name, logical_id, log_group_name, retention in _LOG_GROUP_SPECS
+        }
     
     def _create_iam_roles(self):
         """Create IAM roles for observability functions"""
@@ -96,8 +104,8 @@ class CoreObservabilityStack(Stack):
             self, "ObservabilityLambdaRole",
             assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
             managed_policies=[
-                iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole"),
-                iam.ManagedPolicy.from_aws_managed_policy_name("AWSXRayDaemonWriteAccess")
+                managed_policy("service-role/AWSLambdaBasicExecutionRole"),
+                managed_policy("AWSXRayDaemonWriteAccess")
             ],
             inline_policies={
                 "ObservabilityPolicy": iam.PolicyDocument(
@@ -105,10 +113,19 @@ class CoreObservabilityStack(Stack):
                         iam.PolicyStatement(
                             effect=iam.Effect.ALLOW,
                             actions=[
-                                "cloudwatch:*",
-                                "logs:*",
-                                "events:*",
-                                "sns:*",
+                                "cloudwatch:GetMetricData",
+                                "cloudwatch:GetMetricStatistics",
+                                "cloudwatch:ListMetrics",
+                                "cloudwatch:PutMetricData",
+                                "cloudwatch:DescribeAlarms",
+                                "cloudwatch:GetDashboard",
+                                "cloudwatch:PutDashboard",
+                                "logs:DescribeLogGroups",
+                                "logs:FilterLogEvents",
+                                "logs:StartQuery",
+                                "logs:GetQueryResults",
+                                "logs:StopQuery",
+                                "sns:Publish",
                                 "s3:GetObject",
                                 "s3:PutObject",
                                 "s3:DeleteObject",
@@ -159,15 +176,22 @@ class CoreObservabilityStack(Stack):
             self, "ObservabilityEventBus"
         )
         
-        # Archive events for replay capability
+        # Platform functions only publish to the observability bus
+        self.core_resources["event_bus"].grant_put_events_to(self.core_resources["lambda_role"])
+        
+        # Archive critical and high severity events for replay; lower severities
+        # are rarely replayed and would dominate archive storage
         events.Archive(
             self, "ObservabilityEventArchive",
             source_event_bus=self.core_resources["event_bus"],
-            description="Archive of observability events for replay",
+            description="Archive of critical and high severity observability events for replay",
             event_pattern=events.EventPattern(
-                source=["observability.platform"]
+                source=["observability.platform"],
+                detail={
+                    "severity": ["critical", "high"]
+                }
             ),
-            retention=Duration.days(30)
+            retention=Duration.days(14)
         )
     
     def _create_xray_resources(self):
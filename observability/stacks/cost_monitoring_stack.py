@@ -10,6 +10,8 @@ from aws_cdk import (
 from constructs import Construct
 from typing import Dict, Any
 
+from observability.stacks import PYTHON_3_12
+
 class CostMonitoringStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, environment: str, core_resources: Dict[str, Any], **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -60,7 +62,8 @@ class CostMonitoringStack(Stack):
         
         cost_anomaly_function = lambda_.Function(
             self, "CostAnomalyDetector",
-            runtime=lambda_.Runtime.PYTHON_3_9,
+            runtime=PYTHON_3_12,
+            architecture=lambda_.Architecture.ARM_64,
             handler="index.handler",
             code=lambda_.Code.from_inline("def handler(event, context): return {'statusCode': 200}"),
             role=self.core_resources["lambda_role"],
@@ -87,9 +90,14 @@ class CostMonitoringStack(Stack):
                     cloudwatch.GraphWidget(
                         title="Daily Cost Trend",
                         left=[
+                            # Billing metrics only exist in us-east-1 and are
+                            # published every six hours
                             cloudwatch.Metric(
                                 namespace="AWS/Billing",
                                 metric_name="EstimatedCharges",
+                                dimensions_map={"Currency": "USD"},
+                                region="us-east-1",
+                                period=Duration.hours(6),
                                 statistic="Maximum"
                             )
                         ],
@@ -16,6 +16,11 @@ class DashboardStack(Stack):
         self._create_overview_dashboard()
         self._create_service_dashboards()
     
+    @staticmethod
+    def _metric(namespace: str, metric_name: str, statistic: str = "Average") -> cloudwatch.Metric:
+        """Create a dashboard metric"""
+        return cloudwatch.Metric(namespace=namespace, metric_name=metric_name, statistic=statistic)
+    
     def _create_overview_dashboard(self):
         """Create main overview dashboard"""
         self.overview_dashboard = cloudwatch.Dashboard(
@@ -26,16 +31,8 @@ class DashboardStack(Stack):
                     cloudwatch.GraphWidget(
                         title="Infrastructure Health",
                         left=[
-                            cloudwatch.Metric(
-                                namespace="AWS/EC2",
-                                metric_name="CPUUtilization",
-                                statistic="Average"
-                            ),
-                            cloudwatch.Metric(
-                                namespace="AWS/Lambda",
-                                metric_name="Duration",
-                                statistic="Average"
-                            )
+                            self._metric("AWS/EC2", "CPUUtilization"),
+                            self._metric("AWS/Lambda", "Duration")
                         ],
                         width=12,
                         height=6
@@ -44,25 +41,13 @@ class DashboardStack(Stack):
                 [
                     cloudwatch.SingleValueWidget(
                         title="Active Alarms",
-                        metrics=[
-                            cloudwatch.Metric(
-                                namespace="AWS/CloudWatch",
-                                metric_name="MetricCount",
-                                statistic="Sum"
-                            )
-                        ],
+                        metrics=[self._metric("AWS/CloudWatch", "MetricCount", "Sum")],
                         width=6,
                         height=3
                     ),
                     cloudwatch.SingleValueWidget(
                         title="Error Rate",
-                        metrics=[
-                            cloudwatch.Metric(
-                                namespace="AWS/Lambda",
-                                metric_name="Errors",
-                                statistic="Sum"
-                            )
-                        ],
+                        metrics=[self._metric("AWS/Lambda", "Errors", "Sum")],
                         width=6,
                         height=3
                     )
@@ -79,11 +64,7 @@ class DashboardStack(Stack):
             widgets=[[
                 cloudwatch.GraphWidget(
                     title="EC2 CPU Utilization",
-                    left=[cloudwatch.Metric(
-                        namespace="AWS/EC2",
-                        metric_name="CPUUtilization",
-                        statistic="Average"
-                    )],
+                    left=[self._metric("AWS/EC2", "CPUUtilization")],
                     width=24,
                     height=6
                 )
@@ -4,14 +4,25 @@ from aws_cdk import (
     aws_events as events,
     aws_events_targets as targets,
     aws_logs as logs,
-    aws_kinesis as kinesis,
     aws_kinesisfirehose as firehose,
     aws_cloudwatch as cloudwatch,
+    aws_iam as iam,
     Duration
 )
 from constructs import Construct
 from typing import Dict, Any
 
+from observability.stacks import PYTHON_3_12
+
+# Firehose S3 buffering as (size in MB, interval in seconds) per environment.
+# Larger buffers mean fewer, better-compressed S3 objects; prod uses the
+# Firehose maximum and unlisted environments keep small buffers
+_BUFFERING_HINTS = {
+    "prod": (128, 900),
+    "staging": (64, 600)
+}
+_DEFAULT_BUFFERING_HINTS = (5, 300)
+
 class LogAnalysisStack(Stack):
     def __init__(self, scope: Construct, construct_id: str, environment: str, core_resources: Dict[str, Any], **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -20,51 +31,99 @@ class LogAnalysisStack(Stack):
         self.core_resources = core_resources
         self.log_resources = {}
         
+        # Settings shared by the inline log analysis functions
+        self._architecture = lambda_.Architecture.ARM_64
+        
         # Create log analysis components
         self._create_log_stream()
+        self._create_log_subscriptions()
         self._create_log_processor()
         self._create_log_insights_queries()
         self._create_anomaly_detector()
     
     def _create_log_stream(self):
-        """Create Kinesis stream for log processing"""
-        self.log_resources["stream"] = kinesis.Stream(
-            self, "LogStream",
-            shard_count=2 if self.env_name == "prod" else 1,
-            encryption=kinesis.StreamEncryption.KMS,
-            encryption_key=self.core_resources["kms_key"]
+        """Create Firehose delivery stream for log shipping"""
+        # Direct PUT: the platform log group subscriptions write straight to
+        # Firehose, without an intermediate Kinesis stream
+        buffer_size, buffer_interval = _BUFFERING_HINTS.get(self.env_name, _DEFAULT_BUFFERING_HINTS)
+        
+        # Role Firehose assumes to write to the (KMS encrypted) storage bucket
+        delivery_role = iam.Role(
+            self, "LogFirehoseRole",
+            assumed_by=iam.ServicePrincipal("firehose.amazonaws.com")
         )
+        self.core_resources["storage_bucket"].grant_write(delivery_role)
+        delivery_role.add_to_policy(
+            iam.PolicyStatement(
+                effect=iam.Effect.ALLOW,
+                actions=["s3:GetBucketLocation", "s3:ListBucket", "s3:ListBucketMultipartUploads"],
+                resources=[self.core_resources["storage_bucket"].bucket_arn]
+            )
+        )
+        self.core_resources["kms_key"].grant_encrypt_decrypt(delivery_role)
         
-        # Kinesis Firehose for S3 delivery
         self.log_resources["firehose"] = firehose.CfnDeliveryStream(
             self, "LogFirehose",
-            kinesis_stream_source_configuration=firehose.CfnDeliveryStream.KinesisStreamSourceConfigurationProperty(
-                kinesis_stream_arn=self.log_resources["stream"].stream_arn,
-                role_arn=self.core_resources["lambda_role"].role_arn
+            delivery_stream_type="DirectPut",
+            delivery_stream_encryption_configuration_input=firehose.CfnDeliveryStream.DeliveryStreamEncryptionConfigurationInputProperty(
+                key_type="CUSTOMER_MANAGED_CMK",
+                key_arn=self.core_resources["kms_key"].key_arn
             ),
             extended_s3_destination_configuration=firehose.CfnDeliveryStream.ExtendedS3DestinationConfigurationProperty(
                 bucket_arn=self.core_resources["storage_bucket"].bucket_arn,
                 prefix="logs/year=!{timestamp:yyyy}/month=!{timestamp:MM}/day=!{timestamp:dd}/hour=!{timestamp:HH}/",
                 error_output_prefix="errors/",
                 buffering_hints=firehose.CfnDeliveryStream.BufferingHintsProperty(
-                    size_in_m_bs=5,
-                    interval_in_seconds=300
+                    size_in_m_bs=buffer_size,
+                    interval_in_seconds=buffer_interval
                 ),
-                compression_format="GZIP",
-                role_arn=self.core_resources["lambda_role"].role_arn
+                # CloudWatch Logs subscription payloads arrive gzipped already
+                compression_format="UNCOMPRESSED",
+                role_arn=delivery_role.role_arn
             )
         )
+        
+        # The role's policy must exist before Firehose validates access to S3
+        self.log_resources["firehose"].node.add_dependency(delivery_role)
+    
+    def _create_log_subscriptions(self):
+        """Ship the platform log groups to the delivery stream"""
+        firehose_arn = self.log_resources["firehose"].attr_arn
+        
+        # Role CloudWatch Logs assumes to deliver subscription events
+        subscription_role = iam.Role(
+            self, "LogSubscriptionRole",
+            assumed_by=iam.ServicePrincipal("logs.amazonaws.com"),
+            inline_policies={
+                "FirehoseDelivery": iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            effect=iam.Effect.ALLOW,
+                            actions=["firehose:PutRecord", "firehose:PutRecordBatch"],
+                            resources=[firehose_arn]
+                        )
+                    ]
+                )
+            }
+        )
+        
+        for log_group in self.core_resources["log_groups"].values():
+            logs.CfnSubscriptionFilter(
+                self, f"{log_group.node.id}Subscription",
+                log_group_name=log_group.log_group_name,
+                destination_arn=firehose_arn,
+                filter_pattern="",
+                role_arn=subscription_role.role_arn
+            )
     
     def _create_log_processor(self):
         """Create Lambda function for log processing and enrichment"""
         self.log_resources["processor"] = lambda_.Function(
             self, "LogProcessor",
-            runtime=lambda_.Runtime.PYTHON_3_9,
+            runtime=PYTHON_3_12,
+            architecture=self._architecture,
             handler="index.handler",
             code=lambda_.Code.from_inline("""
-import json
-import base64
-import gzip
 import logging
 
 logger = logging.getLogger()
@@ -102,13 +161,13 @@ def handler(event, context):
         """Create scheduled CloudWatch Logs Insights queries"""
         insights_runner = lambda_.Function(
             self, "LogInsightsRunner",
-            runtime=lambda_.Runtime.PYTHON_3_9,
+            runtime=PYTHON_3_12,
+            architecture=self._architecture,
             handler="index.handler",
             code=lambda_.Code.from_inline("""
 import boto3
-import json
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -118,7 +177,7 @@ def handler(event, context):
         logs_client = boto3.client('logs')
         
         # Simple error count query
-        end_time = datetime.utcnow()
+        end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=1)
         
         # This is a placeholder - in production you'd run actual insights queries
@@ -151,13 +210,11 @@ def handler(event, context):
         """Create log anomaly detection"""
         anomaly_detector = lambda_.Function(
             self, "LogAnomalyDetector",
-            runtime=lambda_.Runtime.PYTHON_3_9,
+            runtime=PYTHON_3_12,
+            architecture=self._architecture,
             handler="index.handler",
             code=lambda_.Code.from_inline("""
-import boto3
-import json
 import logging
-from datetime import datetime, timedelta
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
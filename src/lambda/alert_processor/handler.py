@@ -10,13 +10,14 @@ from .services.notification_service import NotificationService
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Services (and their boto3 clients) are created once per execution
+# environment and reused across warm invocations
+enrichment_service = AlertEnrichmentService()
+notification_service = NotificationService()
+
 def handler(event, context):
     """Main Lambda handler for alert processing"""
     try:
-        # Initialize services
-        enrichment_service = AlertEnrichmentService()
-        notification_service = NotificationService()
-        
         # Process different types of events
         if _is_cloudwatch_alarm(event):
             return _process_cloudwatch_alarm(event, enrichment_service, notification_service)
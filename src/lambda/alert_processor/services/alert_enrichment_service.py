@@ -9,6 +9,13 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Alarm-name keywords per severity, checked in order of precedence
+SEVERITY_KEYWORDS = (
+    ('critical', ('critical', 'fatal', 'down', 'outage')),
+    ('high', ('error', 'high', 'failed', 'timeout')),
+    ('medium', ('warning', 'medium', 'slow')),
+)
+
 class AlertEnrichmentService:
     """Service for enriching alerts with additional context"""
     
@@ -60,17 +67,9 @@ class AlertEnrichmentService:
         """Determine alert severity based on alarm characteristics"""
         alarm_name_lower = alarm_name.lower()
         
-        # Critical severity indicators
-        if any(keyword in alarm_name_lower for keyword in ['critical', 'fatal', 'down', 'outage']):
-            return 'critical'
-        
-        # High severity indicators
-        if any(keyword in alarm_name_lower for keyword in ['error', 'high', 'failed', 'timeout']):
-            return 'high'
-        
-        # Medium severity indicators
-        if any(keyword in alarm_name_lower for keyword in ['warning', 'medium', 'slow']):
-            return 'medium'
+        for severity, keywords in SEVERITY_KEYWORDS:
+            if any(keyword in alarm_name_lower for keyword in keywords):
+                return severity
         
         # Default to low
         return 'low'
@@ -4,12 +4,21 @@ EC2 remediation Lambda function
 import boto3
 import json
 import logging
+import time
+from botocore.config import Config
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-ec2 = boto3.client('ec2')
-cloudwatch = boto3.client('cloudwatch')
+# Client is created once per execution environment and reused when warm
+CLIENT_CONFIG = Config(
+    max_pool_connections=4,
+    connect_timeout=1,
+    read_timeout=5,
+    tcp_keepalive=True,
+    retries={'mode': 'standard', 'total_max_attempts': 3}
+)
+ec2 = boto3.client('ec2', config=CLIENT_CONFIG)
 
 def handler(event, context):
     """Handle EC2 remediation actions"""
@@ -47,14 +56,7 @@ def restart_instance(event, context):
         ec2.reboot_instances(InstanceIds=[instance_id])
         
         # Send metric
-        cloudwatch.put_metric_data(
-            Namespace='Observability/Automation',
-            MetricData=[{
-                'MetricName': 'InstanceRestart',
-                'Value': 1,
-                'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}]
-            }]
-        )
+        emit_metric('InstanceRestart', 1, {'InstanceId': instance_id})
         
         return {'status': 'success', 'instance_id': instance_id}
         
@@ -84,4 +86,19 @@ def check_instance_health(event, context):
 
 def verify_instance_recovery(event, context):
     """Verify instance has recovered"""
-    return check_instance_health(event, context)
\ No newline at end of file
+    return check_instance_health(event, context)
+
+def emit_metric(metric_name, value, dimensions):
+    """Emit metric as a CloudWatch Embedded Metric Format log line"""
+    print(json.dumps({
+        '_aws': {
+            'Timestamp': int(time.time() * 1000),
+            'CloudWatchMetrics': [{
+                'Namespace': 'Observability/Automation',
+                'Dimensions': [list(dimensions)],
+                'Metrics': [{'Name': metric_name, 'Unit': 'Count'}]
+            }]
+        },
+        metric_name: value,
+        **dimensions
+    }))
\ No newline at end of file
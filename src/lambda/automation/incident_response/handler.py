@@ -5,12 +5,24 @@ import boto3
 import json
 import logging
 import os
+from botocore.config import Config
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-stepfunctions = boto3.client('stepfunctions')
-sns = boto3.client('sns')
+# Clients and configuration are resolved once per execution environment
+CLIENT_CONFIG = Config(
+    max_pool_connections=4,
+    connect_timeout=1,
+    read_timeout=5,
+    tcp_keepalive=True,
+    retries={'mode': 'standard', 'total_max_attempts': 3}
+)
+stepfunctions = boto3.client('stepfunctions', config=CLIENT_CONFIG)
+sns = boto3.client('sns', config=CLIENT_CONFIG)
+
+REMEDIATION_WORKFLOW_ARN = os.environ.get('REMEDIATION_WORKFLOW_ARN')
+INCIDENT_TOPIC_ARN = os.environ.get('INCIDENT_TOPIC_ARN')
 
 def handler(event, context):
     """Handle incident response"""
@@ -30,11 +42,10 @@ def handler(event, context):
 
 def start_remediation_workflow(alert_detail):
     """Start automated remediation workflow"""
-    workflow_arn = os.environ.get('REMEDIATION_WORKFLOW_ARN')
-    if workflow_arn:
+    if REMEDIATION_WORKFLOW_ARN:
         try:
             stepfunctions.start_execution(
-                stateMachineArn=workflow_arn,
+                stateMachineArn=REMEDIATION_WORKFLOW_ARN,
                 input=json.dumps(alert_detail)
             )
             logger.info("Started remediation workflow")
@@ -43,11 +54,10 @@ def start_remediation_workflow(alert_detail):
 
 def send_incident_notification(alert_detail):
     """Send incident notification"""
-    topic_arn = os.environ.get('INCIDENT_TOPIC_ARN')
-    if topic_arn:
+    if INCIDENT_TOPIC_ARN:
         try:
             sns.publish(
-                TopicArn=topic_arn,
+                TopicArn=INCIDENT_TOPIC_ARN,
                 Message=json.dumps(alert_detail, indent=2),
                 Subject=f"INCIDENT: {alert_detail.get('alarm_name', 'Unknown')}"
             )
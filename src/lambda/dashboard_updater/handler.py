@@ -11,13 +11,14 @@ from .services.dashboard_service import DashboardService
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Services (and their boto3 clients) are created once per execution
+# environment and reused across warm invocations
+discovery_service = ResourceDiscoveryService()
+dashboard_service = DashboardService()
+
 def handler(event, context):
     """Main Lambda handler for dashboard updates"""
     try:
-        # Initialize services
-        discovery_service = ResourceDiscoveryService()
-        dashboard_service = DashboardService()
-        
         # Discover resources
         resources = discovery_service.discover_all_resources()
         logger.info(f"Discovered {sum(len(v) for v in resources.values())} resources")
@@ -4,6 +4,7 @@ Dashboard management service
 import boto3
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 logger = logging.getLogger(__name__)
@@ -16,25 +17,28 @@ class DashboardService:
     
     def update_dashboards(self, resources: Dict[str, List[str]]) -> List[str]:
         """Update dashboards based on discovered resources"""
-        updated_dashboards = []
-        
-        if resources['ec2_instances']:
-            self._update_ec2_dashboard(resources['ec2_instances'])
-            updated_dashboards.append('EC2')
-        
-        if resources['lambda_functions']:
-            self._update_lambda_dashboard(resources['lambda_functions'])
-            updated_dashboards.append('Lambda')
-        
-        if resources['ecs_clusters']:
-            self._update_ecs_dashboard(resources['ecs_clusters'])
-            updated_dashboards.append('ECS')
+        updates = [
+            (name, update, resources[key])
+            for name, key, update in (
+                ('EC2', 'ec2_instances', self._update_ec2_dashboard),
+                ('Lambda', 'lambda_functions', self._update_lambda_dashboard),
+                ('ECS', 'ecs_clusters', self._update_ecs_dashboard),
+                ('RDS', 'rds_instances', self._update_rds_dashboard)
+            )
+            if resources[key]
+        ]
         
-        if resources['rds_instances']:
-            self._update_rds_dashboard(resources['rds_instances'])
-            updated_dashboards.append('RDS')
+        # put_dashboard calls are independent and network-bound, so run them
+        # concurrently; boto3 clients are safe to share across threads.
+        # Waiting on every result re-raises widget-building errors to the
+        # handler instead of reporting the dashboard as updated
+        if updates:
+            with ThreadPoolExecutor(max_workers=len(updates)) as executor:
+                futures = [executor.submit(update, items) for _, update, items in updates]
+                for future in futures:
+                    future.result()
         
-        return updated_dashboards
+        return [name for name, _, _ in updates]
     
     def _update_ec2_dashboard(self, instances: List[str]):
         """Update EC2 dashboard with current instances"""
@@ -0,0 +1,47 @@
+"""
+Unit tests for monitoring configuration
+"""
+import unittest
+from dataclasses import FrozenInstanceError
+from observability.config.monitoring_config import MetricConfig, get_service_config
+
+class TestMonitoringConfig(unittest.TestCase):
+    """Test cases for monitoring configuration"""
+
+    def test_get_service_config_ec2(self):
+        """Test getting EC2 service configuration"""
+        config = get_service_config('ec2')
+        self.assertEqual(config.service_name, 'EC2')
+        self.assertEqual(config.alerts[0].name, 'HighCPUUtilization')
+        self.assertIn('/aws/ec2/*', config.log_groups)
+
+    def test_get_service_config_unknown(self):
+        """Test getting configuration for unknown service"""
+        self.assertIsNone(get_service_config('unknown'))
+
+    def test_metric_defaults(self):
+        """Test metric configuration defaults"""
+        metric = MetricConfig(namespace="AWS/EC2", metric_name="CPUUtilization", dimensions=())
+        self.assertEqual(metric.statistic, 'Average')
+        self.assertEqual(metric.period, 300)
+
+    def test_configs_are_immutable(self):
+        """Test configuration objects cannot be modified"""
+        config = get_service_config('lambda')
+        with self.assertRaises(FrozenInstanceError):
+            config.service_name = 'Other'
+
+    def test_configs_are_hashable(self):
+        """Test configuration objects can be used as set members and keys"""
+        config = get_service_config('ec2')
+        self.assertEqual(hash(config.metrics[0]), hash(config.alerts[0].metric))
+        self.assertEqual(len({config}), 1)
+
+    def test_alert_metric_shared_with_service_metrics(self):
+        """Test default alerts reuse the service metric instances"""
+        config = get_service_config('lambda')
+        self.assertIn(config.alerts[0].metric, config.metrics)
+        self.assertIs(config.alerts[0].metric, config.metrics[1])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file